@@ -1,9 +1,16 @@
-from pydantic import BaseModel, EmailStr, AnyUrl, Field
-from typing import List, Dict, Optional, Annotated
+import sys
+import threading
+from collections import OrderedDict
+
+from pydantic import BaseModel, ConfigDict, EmailStr, AnyUrl, Field
+from typing import List, Dict, Optional, Sequence, Annotated
+from common_types import Name, Contact
 
 # Patient model using Pydantic
 class Patient(BaseModel):
 
+    model_config = ConfigDict(frozen=True, extra='forbid')  # read-only, unknown keys rejected
+
     # -------------------------------
     # BASIC way to declare datatypes
     # -------------------------------
@@ -21,9 +28,9 @@ class Patient(BaseModel):
     # -------------------------------
     
     # Adds max length, title, description, and example usage
-    name: Annotated[str, Field(max_length=50, title='Name of the patient',
-                               description='Give the name of the patient in less than 50 chars',
-                               examples=['Harsha', 'Pinku'])]
+    name: Annotated[Name, Field(title='Name of the patient',
+                                description='Give the name of the patient in less than 50 chars',
+                                examples=['Harsha', 'Pinku'])]
 
     # Validates email format automatically
     email: EmailStr
@@ -40,24 +47,81 @@ class Patient(BaseModel):
     # Boolean field with default and description
     married: Annotated[bool, Field(default=None, description='Is the patient married or not')]
 
-    # Optional list of allergies with default value and max length restriction
-    allergies: Annotated[Optional[List[str]], Field(default='No allergies', max_length=5)]
+    # Optional list of allergies, empty tuple by default, with max length restriction
+    allergies: Annotated[Optional[Sequence[str]], Field(default_factory=tuple, max_length=5)]
+
+    # Contact details → TypedDict with known keys (email, phone)
+    contact_details: Contact
+
+    # Trusted input → build without validation
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'Patient':
+        # Skips validation entirely → only for already-validated data (e.g. DB rows)
+        return cls.model_construct(**data)
+
+
+# Reusable validator → Pydantic compiles one SchemaValidator per class,
+# so reuse it directly instead of going through Patient.__init__ on every row
+_VALIDATOR = Patient.__pydantic_validator__
+
+
+def build(data: dict) -> Patient:
+    return _VALIDATOR.validate_python(data)  # dict → validated Patient
+
 
-    # Contact details remain dictionary but validated strictly
-    contact_details: Dict[str, str]
+def validate_many(rows):
+    return list(map(_VALIDATOR.validate_python, rows))  # batch ingest
 
 
+# Memoized build → repeated identical inputs (retries, polling) are validated once.
+# The key records every value AND its type, so e.g. a tuple and a list never share an entry.
+_CACHE = OrderedDict()
+_CACHE_SIZE = 4096
+_CACHE_LOCK = threading.Lock()  # web services call this from many threads
+
+
+def _cache_key(value):
+    if isinstance(value, dict):
+        return dict, tuple(sorted((k, _cache_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(map(_cache_key, value))
+    return type(value), value
+
+
+def cached_build(data: dict) -> Patient:
+    try:
+        key = _cache_key(data)
+        hash(key)
+    except TypeError:  # unhashable / unsortable input → no cache, just validate
+        return build(data)
+    with _CACHE_LOCK:
+        patient = _CACHE.get(key)
+        if patient is not None:
+            _CACHE.move_to_end(key)
+    if patient is None:
+        patient = build(data)  # validate outside the lock
+        with _CACHE_LOCK:
+            _CACHE[key] = patient
+            if len(_CACHE) > _CACHE_SIZE:
+                _CACHE.popitem(last=False)  # drop least recently used
+    return patient.model_copy(deep=True)  # own copy → callers never share mutable fields
+
+
+# One write per call instead of one print per field
+_INSERT_TEMPLATE = '%s\n%s\n%s\n%s\n%s\n%s\n%s\n%s\ninserted\n'
+
 # Example function to insert patient data
 def insert_patient_data(patient: Patient):
-    print(patient.name)
-    print(patient.email)
-    print(patient.linkedin)
-    print(patient.age)
-    print(patient.weight) 
-    print(patient.married) 
-    print(patient.allergies) 
-    print(patient.contact_details) 
-    print('inserted')
+    sys.stdout.write(_INSERT_TEMPLATE % (
+        patient.name,
+        patient.email,
+        patient.linkedin,
+        patient.age,
+        patient.weight,
+        patient.married,
+        patient.allergies,
+        patient.contact_details,
+    ))
 
 
 # Sample patient data
@@ -71,7 +135,16 @@ patient_info = {
 }
 
 # Validation + coercion happens here
-patient1 = Patient(**patient_info)
+patient1 = build(patient_info)
+
+# Same input again (e.g. a retried request) → first call validates, second is a cache hit
+patient2 = cached_build(patient_info)
+patient3 = cached_build(patient_info)
+print('cached copies equal:', patient2 == patient3, '| same object:', patient2 is patient3)
+
+# Already-validated data (e.g. read back from the DB) → skip validation
+patient4 = Patient.from_trusted(patient1.model_dump())
+print('trusted copy equal:', patient4 == patient1)
 
 # Insert data
 insert_patient_data(patient1)
\ No newline at end of file
@@ -1,9 +1,18 @@
-from pydantic import BaseModel, EmailStr, AnyUrl, Field, field_validator
-from typing import List, Dict, Optional, Annotated
+import re
+import sys
+
+from pydantic import BaseModel, ConfigDict, AnyUrl, Field, AfterValidator, field_validator
+from typing import List, Dict, Optional, Sequence, Annotated
+from common_types import Name, Contact
+
+# One precompiled check → email format (single @, no spaces) + allowed domains (hdfc.com / icici.com)
+_VALID_EMAIL = re.compile(r'[^@\s]+@(hdfc|icici)\.com', re.IGNORECASE).fullmatch
 
 # Patient model using Pydantic
 class Patient(BaseModel):  # BaseModel → enables validation, serialization, type coercion
 
+    model_config = ConfigDict(frozen=True, extra='forbid')  # read-only, unknown keys rejected
+
     # -------------------------------
     # BASIC way to declare datatypes
     # -------------------------------
@@ -22,21 +31,22 @@ class Patient(BaseModel):  # BaseModel → enables validation, serialization, ty
     # -------------------------------
 
     # Annotated → combines type + validation rules + metadata (title, description, examples)
-    name: Annotated[str, Field(
-        max_length=50,
+    # AfterValidator(str.upper) → transforms name to uppercase with the builtin
+    # C method directly (no Python-level validator function per call)
+    name: Annotated[Name, Field(
         title='Name of the patient',
         description='Give the name of the patient in less than 50 chars',
         examples=['Harsha', 'Pinku']
-    )]
+    ), AfterValidator(str.upper)]
 
-    # EmailStr → enforces valid email format
-    email: EmailStr
+    # Plain str → format and domain are both checked by email_validator below
+    email: str
 
     # AnyUrl → ensures linkedin is a valid URL
     linkedin: AnyUrl
     
     # stricter version with conditions:
-    age: int = Field(gt=0, lt=25)   # restricts to 0 < age < 25
+    age: int = Field(gt=0, lt=50)   # restricts to 0 < age < 50
 
     # weight: float = Field(gt=0)     # weight must be > 0
     weight: Annotated[float, Field(gt=0, strict=True)]  
@@ -48,15 +58,15 @@ class Patient(BaseModel):  # BaseModel → enables validation, serialization, ty
         description='Is the patient married or not'
     )]
 
-    # Optional → can be None, default set to "No allergies"
+    # Optional → can be None, default is an empty (immutable) tuple
     # max_length=5 → max 5 allergy items allowed
-    allergies: Annotated[Optional[List[str]], Field(
-        default='No allergies',
+    allergies: Annotated[Optional[Sequence[str]], Field(
+        default_factory=tuple,
         max_length=5
     )]
 
-    # Dictionary is still enforced but validated more strictly
-    contact_details: Dict[str, str]
+    # TypedDict → only the known contact keys are validated (email, phone)
+    contact_details: Contact
 
 
     # -------------------------------
@@ -66,54 +76,67 @@ class Patient(BaseModel):  # BaseModel → enables validation, serialization, ty
     @field_validator('email')  # runs only on email field
     @classmethod
     def email_validator(cls, value):
-        valid_domains = ['hdfc.com', 'icici.com']
-        domain_name = value.split('@')[-1]
+        # Custom rule: valid email format AND only hdfc.com or icici.com domains
+        if not _VALID_EMAIL(value):
+            raise ValueError('Not a valid hdfc.com or icici.com email')
+        local, _, domain = value.rpartition('@')
+        return f'{local}@{domain.lower()}'  # domain lowercased, as EmailStr does
 
-        # Custom rule: only allow hdfc.com or icici.com domains
-        if domain_name not in valid_domains:
-            raise ValueError('Not a valid domain')
-        return value  # return validated email
+    # -------------------------------
+    # TRUSTED INPUT
+    # -------------------------------
 
-    @field_validator('name')  # runs only on name field
     @classmethod
-    def transform_name(cls, value):
-        # Automatically transforms name to uppercase
-        return value.upper()
+    def from_trusted(cls, data: dict) -> 'Patient':
+        # Skips validation entirely → only for already-validated data (e.g. DB rows)
+        return cls.model_construct(**data)
 
-    @field_validator('age', mode='before')  
-    # mode='before' → validation happens before type coercion
-    @classmethod
-    def validate_age(cls, value):
-        # Custom rule: age must be between 0 and 50
-        if 0 < value < 50:
-            return value
-        else:
-            raise ValueError('Age should be in between 0 and 50')
+
+# -------------------------------
+# REUSABLE VALIDATOR
+# Pydantic compiles one SchemaValidator per class → reuse it directly
+# instead of going through Patient.__init__ on every row
+# -------------------------------
+_VALIDATOR = Patient.__pydantic_validator__
+
+
+def build(data: dict) -> Patient:
+    return _VALIDATOR.validate_python(data)  # dict → validated Patient
+
+
+def validate_many(rows):
+    return list(map(_VALIDATOR.validate_python, rows))  # batch ingest
 
 
 # -------------------------------
 # FUNCTIONS USING MODEL
 # -------------------------------
+# One write per call instead of one print per field
+_INSERT_TEMPLATE = '%s\n%s\n%s\n%s\n%s\n%s\n%s\n%s\ninserted\n'
+_UPDATE_TEMPLATE = '%s\n%s\n%s\n%s\n%s\n%s\n%s\nupdated\n'
+
 def insert_patient_data(patient: Patient):  # accepts validated Patient model
-    print(patient.name)
-    print(patient.email)
-    print(patient.linkedin)
-    print(patient.age)
-    print(patient.weight) 
-    print(patient.married) 
-    print(patient.allergies) 
-    print(patient.contact_details) 
-    print('inserted')
+    sys.stdout.write(_INSERT_TEMPLATE % (
+        patient.name,
+        patient.email,
+        patient.linkedin,
+        patient.age,
+        patient.weight,
+        patient.married,
+        patient.allergies,
+        patient.contact_details,
+    ))
 
 def update_patient_data(patient: Patient):
-    print(patient.name)
-    print(patient.email)
-    print(patient.age)
-    print(patient.weight) 
-    print(patient.married) 
-    print(patient.allergies) 
-    print(patient.contact_details) 
-    print('updated')
+    sys.stdout.write(_UPDATE_TEMPLATE % (
+        patient.name,
+        patient.email,
+        patient.age,
+        patient.weight,
+        patient.married,
+        patient.allergies,
+        patient.contact_details,
+    ))
 
 
 # -------------------------------
@@ -123,15 +146,15 @@ patient_info = {
     'name': 'harsha',
     'email': 'abc@hdfc.com',    # passes custom domain validator
     'linkedin': 'http://linkedin.com/',
-    'age': 28,                  # int is fine, validator checks range
+    'age': 28,                  # int is fine, Field checks range
     'weight': 44.2,             # valid float
     # 'married': True,           # optional
     # 'allergies': ['pollen', 'dust'],
     'contact_details': {'email':'abc@gmail.com', 'phone': '12345'}
 }
 
-# Unpack dict into Patient model → validation + type coercion happen here
-patient1 = Patient(**patient_info)
+# Validate dict into Patient model → validation + type coercion happen here
+patient1 = build(patient_info)
 
 # Insert validated patient data
 insert_patient_data(patient1)
@@ -1,5 +1,8 @@
-from pydantic import BaseModel, EmailStr, AnyUrl, Field, model_validator
-from typing import List, Dict, Optional, Annotated
+import sys
+
+from pydantic import BaseModel, ConfigDict, EmailStr, AnyUrl, Field, model_validator
+from typing import List, Dict, Optional, Sequence, Annotated
+from common_types import Name, Contact
 
 # ----------------------------------------------------
 # BASIC VERSION → just type annotations
@@ -22,9 +25,11 @@ class PatientBasic(BaseModel):  # simple version with only types
 
 class Patient(BaseModel):  # Inherit from BaseModel → enables Pydantic validation
 
+    # ---- CONFIG ----
+    model_config = ConfigDict(frozen=True, extra='forbid')  # read-only, unknown keys rejected
+
     # ---- FIELD DEFINITIONS ----
-    name: Annotated[str, Field(
-        max_length=50,
+    name: Annotated[Name, Field(
         title='Name of the patient',
         description='Give the name of the patient in less than 50 chars',
         examples=['Harsha', 'Pinku']
@@ -42,12 +47,12 @@ class Patient(BaseModel):  # Inherit from BaseModel → enables Pydantic validat
         description='Is the patient married or not'
     )]
 
-    allergies: Annotated[Optional[List[str]], Field(
-        default='No allergies',
+    allergies: Annotated[Optional[Sequence[str]], Field(
+        default_factory=tuple,  # empty tuple → immutable default
         max_length=5  # at most 5 items
     )]
 
-    contact_details: Dict[str, str]
+    contact_details: Contact  # email, phone (+ optional emergency)
 
     # ---- CUSTOM VALIDATOR ----
 
@@ -57,31 +62,60 @@ class Patient(BaseModel):  # Inherit from BaseModel → enables Pydantic validat
             raise ValueError('patients older than 60 must have emergency contact')
         return model
 
+    # ---- TRUSTED INPUT ----
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'Patient':
+        # Skips validation entirely → only for already-validated data (e.g. DB rows)
+        return cls.model_construct(**data)
+
+
+# ----------------------------------------------------
+# REUSABLE VALIDATOR
+# Pydantic compiles one SchemaValidator per class → reuse it directly
+# instead of going through Patient.__init__ on every row
+# ----------------------------------------------------
+_VALIDATOR = Patient.__pydantic_validator__
+
+
+def build(data: dict) -> Patient:
+    return _VALIDATOR.validate_python(data)  # dict → validated Patient
+
+
+def validate_many(rows):
+    return list(map(_VALIDATOR.validate_python, rows))  # batch ingest
+
 
 # ----------------------------------------------------
 # FUNCTIONS USING MODEL
 # ----------------------------------------------------
+# One write per call instead of one print per field
+_INSERT_TEMPLATE = '%s\n%s\n%s\n%s\n%s\n%s\n%s\n%s\ninserted\n'
+_UPDATE_TEMPLATE = '%s\n%s\n%s\n%s\n%s\n%s\n%s\n%s\nupdated\n'
+
 def insert_patient_data(patient: Patient):
-    print(patient.name)
-    print(patient.email)
-    print(patient.linkedin)
-    print(patient.age)
-    print(patient.weight)
-    print(patient.married)
-    print(patient.allergies)
-    print(patient.contact_details)
-    print('inserted')
+    sys.stdout.write(_INSERT_TEMPLATE % (
+        patient.name,
+        patient.email,
+        patient.linkedin,
+        patient.age,
+        patient.weight,
+        patient.married,
+        patient.allergies,
+        patient.contact_details,
+    ))
 
 def update_patient_data(patient: Patient):
-    print(patient.name)
-    print(patient.email)
-    print(patient.linkedin)
-    print(patient.age)
-    print(patient.weight)
-    print(patient.married)
-    print(patient.allergies)
-    print(patient.contact_details)
-    print('updated')
+    sys.stdout.write(_UPDATE_TEMPLATE % (
+        patient.name,
+        patient.email,
+        patient.linkedin,
+        patient.age,
+        patient.weight,
+        patient.married,
+        patient.allergies,
+        patient.contact_details,
+    ))
 
 
 # ----------------------------------------------------
@@ -98,6 +132,6 @@ patient_info = {
     'contact_details': {'email': 'abc@gmail.com', 'phone': '12345'}
 }
 
-patient1 = Patient(**patient_info)  # dict unpacking + validation + coercion
+patient1 = build(patient_info)  # validation + coercion
 insert_patient_data(patient1)
 # update_patient_data(patient1)
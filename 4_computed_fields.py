@@ -1,5 +1,8 @@
-from pydantic import BaseModel, EmailStr, AnyUrl, Field, computed_field
+import sys
+
+from pydantic import BaseModel, ConfigDict, EmailStr, AnyUrl, Field, computed_field
 from typing import List, Dict, Optional, Annotated
+from common_types import Name, Age, Contact
 
 # ----------------------------------------------------
 # BASIC VERSION → only type annotations
@@ -21,9 +24,11 @@ class PatientBasic(BaseModel):
 # ----------------------------------------------------
 class Patient(BaseModel):
 
+    # ---- CONFIG ----
+    model_config = ConfigDict(frozen=True, extra='forbid')  # read-only, unknown keys rejected
+
     # ---- FIELD DEFINITIONS ----
-    name: Annotated[str, Field(
-        max_length=50,
+    name: Annotated[Name, Field(
         title="Patient's Name",
         description="Enter full name of the patient (≤ 50 characters)",
         examples=["Harsha", "Pinku"]
@@ -32,7 +37,7 @@ class Patient(BaseModel):
     email: EmailStr  # ensures correct email format
     linkedin: AnyUrl  # validates proper URL
 
-    age: Annotated[int, Field(gt=0, lt=120)]  # realistic age check
+    age: Age  # realistic age check
     weight: Annotated[float, Field(gt=0)]  # must be > 0
     height: Annotated[float, Field(gt=0)]  # must be > 0
 
@@ -47,42 +52,70 @@ class Patient(BaseModel):
         description="List of patient allergies"
     )]
 
-    contact_details: Dict[str, str]  # dictionary of contact info
+    contact_details: Contact  # email + phone contact info
 
     # ---- COMPUTED FIELD ----
     @computed_field  # automatically computed field
     @property
     def calculate_bmi(self) -> float:
         """Auto-calculated Body Mass Index (BMI)."""
-        return round(self.weight / (self.height ** 2), 2)
+        return round(self.weight / (self.height * self.height), 2)  # h*h avoids float.__pow__
+
+    # ---- TRUSTED INPUT ----
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'Patient':
+        # Skips validation entirely → only for already-validated data (e.g. DB rows)
+        return cls.model_construct(**data)
+
+
+# ----------------------------------------------------
+# REUSABLE VALIDATOR
+# Pydantic compiles one SchemaValidator per class → reuse it directly
+# instead of going through Patient.__init__ on every row
+# ----------------------------------------------------
+_VALIDATOR = Patient.__pydantic_validator__
+
+
+def build(data: dict) -> Patient:
+    return _VALIDATOR.validate_python(data)  # dict → validated Patient
+
+
+def validate_many(rows):
+    return list(map(_VALIDATOR.validate_python, rows))  # batch ingest
 
 
 # ----------------------------------------------------
 # FUNCTIONS USING MODEL
 # ----------------------------------------------------
+# One write per call instead of one print per field
+_INSERT_TEMPLATE = '%s\n%s\n%s\n%s\n%s\n%s\n%s\n%s\ninserted\n'
+_UPDATE_TEMPLATE = '%s\n%s\n%s\n%s\n%s\n%s\n%s\n%s\nBMI: %s\nupdated\n'
+
 def insert_patient_data(patient: Patient):
-    print(patient.name)
-    print(patient.email)
-    print(patient.linkedin)
-    print(patient.age)
-    print(patient.weight)
-    print(patient.married)
-    print(patient.allergies)
-    print(patient.contact_details)
-    print('inserted')
+    sys.stdout.write(_INSERT_TEMPLATE % (
+        patient.name,
+        patient.email,
+        patient.linkedin,
+        patient.age,
+        patient.weight,
+        patient.married,
+        patient.allergies,
+        patient.contact_details,
+    ))
 
 
 def update_patient_data(patient: Patient):
-    print(patient.name)
-    print(patient.email)
-    print(patient.linkedin)
-    print(patient.age)
-    print(patient.weight)
-    print(patient.married)
-    print(patient.allergies)
-    print(patient.contact_details)
-    print('BMI:', patient.calculate_bmi)
-    print('updated')
+    sys.stdout.write(_UPDATE_TEMPLATE % (
+        patient.name,
+        patient.email,
+        patient.linkedin,
+        patient.age,
+        patient.weight,
+        patient.married,
+        patient.allergies,
+        patient.contact_details,
+        patient.calculate_bmi,
+    ))
 
 
 # ----------------------------------------------------
@@ -100,6 +133,6 @@ patient_info = {
     'contact_details': {'email': 'abc@gmail.com', 'phone': '12345'}
 }
 
-patient1 = Patient(**patient_info)  # dict unpacking + validation
+patient1 = build(patient_info)  # validation
 # insert_patient_data(patient1)
 update_patient_data(patient1)
\ No newline at end of file
@@ -7,8 +7,9 @@
 # Automatic validation: nested models are validated automatically - no extra work needed
 # ----------------------------------------------------
 
-from pydantic import BaseModel, Field
-from typing import Annotated
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Annotated, List
+from common_types import Name, Gender, Age, Pin
 
 
 # ----------------------------------------------------
@@ -31,6 +32,8 @@ class PatientBasic(BaseModel):
 # ENHANCED VERSION → with validation + metadata
 # ----------------------------------------------------
 class Address(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')  # read-only, unknown keys rejected
+
     city: Annotated[str, Field(
         min_length=2,
         description="City name (at least 2 characters)",
@@ -41,27 +44,33 @@ class Address(BaseModel):
         description="State code or name",
         examples=["MH", "KA"]
     )]
-    pin: Annotated[int, Field(
-        ge=100000, le=999999,
+    pin: Annotated[Pin, Field(
         description="6-digit postal PIN code"
     )]
 
 
 class Patient(BaseModel):
-    name: Annotated[str, Field(
-        max_length=50,
+    model_config = ConfigDict(frozen=True, extra='forbid')  # read-only, unknown keys rejected
+
+    name: Annotated[Name, Field(
         description="Patient's full name"
     )]
-    gender: Annotated[str, Field(
-        pattern="^(male|female|other)$",
+    gender: Annotated[Gender, Field(
         description="Gender of the patient (male/female/other)"
     )]
-    age: Annotated[int, Field(
-        gt=0, lt=120,
+    age: Annotated[Age, Field(
         description="Age of the patient (0 < age < 120)"
     )]
     address: Address  # Nested model → auto-validates Address fields
 
+    # Trusted input (e.g. DB rows) → build without validation
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'Patient':
+        address = data['address']
+        if isinstance(address, dict):  # model_construct does not build nested models itself
+            address = Address.model_construct(**address)
+        return cls.model_construct(**{**data, 'address': address})
+
 
 # ----------------------------------------------------
 # SAMPLE DATA
@@ -71,20 +80,35 @@ address_dict = {
     'state': 'MH',
     'pin': '411014'  # str → coerced into int
 }
-address1 = Address(**address_dict)
 
 patient_dict = {
     'name': 'Harsha',
     'gender': 'female',
     'age': '28',  # str → coerced into int
-    'address': address1  # can pass model instance or dict
+    'address': address_dict  # plain dict → validated into Address (model instance also works)
 }
 patient1 = Patient(**patient_dict)
 
 
+# ----------------------------------------------------
+# BATCH VALIDATION
+# TypeAdapter → build the list validator once, then validate many rows
+# in one call (nested Address dicts included) instead of one Patient(...) each
+# ----------------------------------------------------
+_PATIENTS = TypeAdapter(List[Patient])
+
+rows = [
+    patient_dict,
+    {'name': 'Pinku', 'gender': 'male', 'age': 30,
+     'address': {'city': 'Mumbai', 'state': 'MH', 'pin': 400001}},
+]
+patients = _PATIENTS.validate_python(rows)
+
+
 # ----------------------------------------------------
 # OUTPUTS
 # ----------------------------------------------------
 print(patient1)                # full model
 print("Age:", patient1.age)    # validated int
-print("PIN:", patient1.address.pin)  # nested model field access
\ No newline at end of file
+print("PIN:", patient1.address.pin)  # nested model field access
+print("Batch:", len(patients), "patients validated")
\ No newline at end of file
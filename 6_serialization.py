@@ -8,7 +8,9 @@
 # Including/excluding specific fields
 # ----------------------------------------------------
 
-from pydantic import BaseModel, Field
+import json
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Annotated
 
 
@@ -32,17 +34,29 @@ class PatientBasic(BaseModel):
 # ENHANCED VERSION → with serialization options
 # ----------------------------------------------------
 class Address(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')  # read-only, unknown keys rejected
+
     city: Annotated[str, Field(description="City name")]
     state: Annotated[str, Field(description="State code")]
     pin: Annotated[int, Field(description="Postal code (6 digits)")]
 
 
 class Patient(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')  # read-only, unknown keys rejected
+
     name: Annotated[str, Field(default='User', description="Default = 'User' if not provided")]
     gender: str
     age: int
     address: Address
 
+    # Trusted input (e.g. DB rows) → build without validation
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'Patient':
+        address = data['address']
+        if isinstance(address, dict):  # model_construct does not build nested models itself
+            address = Address.model_construct(**address)
+        return cls.model_construct(**{**data, 'address': address})
+
 
 # ----------------------------------------------------
 # SAMPLE DATA
@@ -62,13 +76,22 @@ patient_dict = {
 }
 patient1 = Patient(**patient_dict)
 
+# Reusable serializer + field sets built once (not on every dump call)
+_ADAPTER = TypeAdapter(Patient)
+_NAME_AGE = frozenset({'name', 'age'})  # used for both include and exclude
+
 
 # ----------------------------------------------------
 # SERIALIZATION DEMOS
 # ----------------------------------------------------
+# Serialize ONCE to JSON, derive the dict from it when needed
+# (all fields here are JSON-native, so both forms hold the same data)
+payload = patient1.model_dump_json()
+full_dict = json.loads(payload)
+
 # Default: full dict
 print("\ Full dict:")
-print(patient1.model_dump())
+print(full_dict)
 
 # Exclude default/unset fields (here "name" was not provided → excluded)
 print("\ Exclude unset (exclude_unset=True):")
@@ -76,19 +99,19 @@ print(patient1.model_dump(exclude_unset=True))
 
 # Only include specific fields
 print("\ Only include ['name', 'age']:")
-print(patient1.model_dump(include=['name', 'age']))
+print(_ADAPTER.dump_python(patient1, include=_NAME_AGE))
 
 # Exclude specific fields
 print("\ Exclude ['name', 'age']:")
-print(patient1.model_dump(exclude=['name', 'age']))
+print(_ADAPTER.dump_python(patient1, exclude=_NAME_AGE))
 
 # JSON serialization (string format, ready for APIs)
 print("\ JSON output:")
-print(patient1.model_dump_json())
+print(payload)
 
 
 # ----------------------------------------------------
 # OUTPUT TYPES
 # ----------------------------------------------------
-print("\nType of model_dump →", type(patient1.model_dump()))
-print("Type of model_dump_json →", type(patient1.model_dump_json()))
\ No newline at end of file
+print("\nType of json.loads(payload) →", type(full_dict))
+print("Type of model_dump_json →", type(payload))
\ No newline at end of file
@@ -0,0 +1,23 @@
+# ----------------------------------------------------
+# COMMON TYPES
+# Reusable annotated types shared by the Patient examples
+# Declaring a constraint once means every model reuses the same definition
+# (e.g. one age range instead of a copy per class)
+# ----------------------------------------------------
+
+from pydantic import Field
+from typing import Annotated, Literal
+from typing_extensions import NotRequired, TypedDict  # pydantic needs typing_extensions.TypedDict on Python < 3.12
+
+
+Name = Annotated[str, Field(max_length=50)]                     # at most 50 chars
+Gender = Literal["male", "female", "other"]                      # fixed set, no regex needed
+Age = Annotated[int, Field(gt=0, lt=120)]                        # realistic age check
+Pin = Annotated[int, Field(ge=100000, le=999999)]                # 6-digit PIN code
+
+
+# Fixed-shape contact info → known keys instead of an arbitrary Dict[str, str]
+class Contact(TypedDict):
+    email: str
+    phone: str
+    emergency: NotRequired[str]  # required for patients older than 60 (see 3_model_validator.py)